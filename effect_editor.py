@@ -2834,7 +2834,7 @@ _CUSTOM_EFFECTS_FILE = _pathlib.Path.home() / ".mystrow_custom_effects.json"
 def _load_custom_effects() -> list:
     try:
         if _CUSTOM_EFFECTS_FILE.exists():
-            data = _json.loads(_CUSTOM_EFFECTS_FILE.read_text(encoding="utf-8"))
+            data = _json.loads(_CUSTOM_EFFECTS_FILE.read_bytes())
             if isinstance(data, list):
                 return data
     except Exception:
@@ -2842,6 +2842,24 @@ def _load_custom_effects() -> list:
     return []
 
 
+def custom_effects_mtime() -> int:
+    """mtime (ns) du fichier des effets personnalises, 0 s'il est absent"""
+    try:
+        return _CUSTOM_EFFECTS_FILE.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def load_all_effects() -> list:
+    """Effets builtin + personnalises (un effet custom ne masque pas un builtin)"""
+    all_effects = list(BUILTIN_EFFECTS)
+    existing_names = {e["name"] for e in all_effects}
+    for e in _load_custom_effects():
+        if e.get("name") not in existing_names:
+            all_effects.append(e)
+    return all_effects
+
+
 def _save_custom_effects(effects: list):
     try:
         _CUSTOM_EFFECTS_FILE.write_text(
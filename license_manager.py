@@ -9,6 +9,7 @@ import sys
 import json
 import time
 import hashlib
+import mmap
 import subprocess
 import platform
 import base64
@@ -419,11 +420,11 @@ def check_exe_integrity() -> bool:
         return True
 
     try:
-        sha256 = hashlib.sha256()
+        # Fichier mappe en memoire : un seul update() sur tout l'exe, la
+        # lecture anticipee est geree par le noyau (pas de boucle de 8 Ko)
         with open(exe_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        exe_hash = sha256.hexdigest()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                exe_hash = hashlib.sha256(mm).hexdigest()
 
         with open(sig_path, "r") as f:
             sig_data = json.load(f)
@@ -27,6 +27,7 @@ Structure des modules:
 import sys
 import os
 import time
+import logging
 
 # Fix encodage console Windows (cp1252 ne supporte pas les emojis)
 if hasattr(sys.stdout, 'reconfigure'):
@@ -140,6 +141,10 @@ def _show_integrity_error():
 # ------------------------------------------------------------------
 def main():
     """Point d'entree principal de Maestro"""
+    # Traces de debug UI (maestro.ui) desactivees en production : les messages
+    # ne sont ni formates ni ecrits sur stdout
+    logging.getLogger("maestro.ui").setLevel(logging.WARNING)
+
     print(tr("starting", app=APP_NAME, ver=VERSION))
     print(tr("modular_mode"))
     print("-" * 40)
@@ -213,10 +218,6 @@ def main():
         _dlg.exec()
         sys.exit(1)
 
-    # Lancer la verification des mises a jour en arriere-plan
-    update_checker = UpdateChecker()
-    update_checker.start()
-
     # ------------------------------------------------------------------
     # VERIFICATION INTEGRITE (anti-patch, uniquement en mode frozen)
     # ------------------------------------------------------------------
@@ -384,9 +385,13 @@ def main():
     app.processEvents()
     window = MainWindow(license_result=license_result)
 
-    # Connecter le signal de mise a jour
+    # Verification des mises a jour en arriere-plan : connectee avant le
+    # demarrage (un resultat en cache arrive tout de suite) et lancee une fois
+    # la boucle d'evenements libre, hors du chemin critique du splash
+    update_checker = UpdateChecker()
     update_checker.update_available.connect(window.on_update_available)
     window._update_checker = update_checker
+    update_checker.start_deferred()
 
     # Garantir un affichage minimum de 5 secondes
     elapsed = time.time() - start_time
@@ -8734,8 +8734,7 @@ class MainWindow(QMainWindow):
 
         def on_vol_changed(v):
             vol_label.setText(f"{v}%")
-            cart.volume = v
-            cart._update_style()
+            cart.set_volume(v)
             # Appliquer en temps reel si en lecture
             if self.cart_playing_index == index:
                 self.cart_audio.setVolume(v / 100.0)
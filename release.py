@@ -65,10 +65,13 @@ def update_version(new_version):
 
 def generate_sig_file(exe_path):
     """Genere MyStrow.exe.sig (hash SHA256 + signature Ed25519)"""
-    sha256 = hashlib.sha256()
     with open(exe_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
+        if hasattr(hashlib, "file_digest"):   # Python 3.11+
+            sha256 = hashlib.file_digest(f, "sha256")
+        else:
+            sha256 = hashlib.sha256()
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha256.update(chunk)
     exe_hash = sha256.hexdigest()
 
     signature = ""
@@ -0,0 +1,35 @@
+"""Comparaison de versions du updater (version_gt / _version_tuple)"""
+import pytest
+
+updater = pytest.importorskip("updater", exc_type=ImportError)
+version_gt = updater.version_gt
+
+
+def test_numeric_components():
+    assert version_gt("2.10.0", "2.9.9")
+    assert not version_gt("2.5.0", "2.5.0")
+    assert version_gt("v2.5.1", "2.5.0")
+
+
+def test_prerelease_number_is_numeric():
+    assert version_gt("1.0rc10", "1.0rc2")
+    assert not version_gt("1.0rc2", "1.0rc10")
+
+
+def test_prerelease_before_final():
+    assert version_gt("1.0", "1.0rc1")
+    assert version_gt("1.0rc1", "1.0b2")
+    assert version_gt("1.0-beta", "1.0-alpha")
+    assert version_gt("1.0a1", "1.0.dev3")
+
+
+def test_post_release_after_final():
+    assert version_gt("1.0.post1", "1.0")
+    assert version_gt("1.0-post2", "1.0.post1")
+    assert not version_gt("1.0", "1.0.post1")
+
+
+def test_local_suffix_ignored():
+    assert not version_gt("1.0+abc", "1.0")
+    assert not version_gt("1.0", "1.0+abc")
+    assert updater._version_tuple("1.0+abc") == updater._version_tuple("1.0")
@@ -4,16 +4,17 @@ Editeur de timeline lumiere - LightTimelineEditor
 import os
 import json
 import hashlib
+import logging
 import random
 from i18n import tr
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QToolButton,
     QScrollArea, QWidget, QComboBox, QProgressBar, QCheckBox,
     QMessageBox, QApplication, QMenuBar, QMenu, QSizePolicy, QFrame,
-    QFileDialog, QSplitter
+    QFileDialog, QSplitter, QRubberBand
 )
 from PySide6.QtCore import Qt, QSize, QTimer, QUrl, QPoint, QRect, QMimeData
-from PySide6.QtGui import QColor, QPainter, QPen, QPolygon, QPalette, QBrush, QCursor, QKeySequence, QShortcut, QDrag, QPixmap
+from PySide6.QtGui import QColor, QPainter, QPen, QPolygon, QPalette, QCursor, QKeySequence, QShortcut, QDrag, QPixmap
 try:
     from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 except ImportError:
@@ -50,40 +51,31 @@ from core import media_icon, create_icon
 from effect_editor import EffectEditorDialog
 from plan_de_feu import PlanDeFeu
 
+log = logging.getLogger("maestro.ui")
 
-class _AnalysisCancelled(Exception):
-    """Exception interne pour interrompre l'analyse audio"""
-    pass
+_ORIGIN = QPoint(0, 0)
 
 
-class RubberBandOverlay(QWidget):
-    """Overlay transparent pour dessiner le rectangle de selection"""
+class _SelectionBand(QRubberBand):
+    """Rubber band de selection : fond cyan translucide + bordure pointillee
+    (QRubberBand ignore les feuilles de style, on le dessine nous-memes)"""
 
     def __init__(self, parent=None):
-        super().__init__(parent)
+        super().__init__(QRubberBand.Rectangle, parent)
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
-        self.setAttribute(Qt.WA_TranslucentBackground)
-        self.rect = None
-
-    def set_rect(self, rect):
-        self.rect = rect
-        self.update()
-
-    def clear(self):
-        self.rect = None
-        self.update()
 
     def paintEvent(self, event):
-        if self.rect:
-            painter = QPainter(self)
-            painter.setRenderHint(QPainter.Antialiasing)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(QColor(0, 212, 255, 50))
+        painter.setPen(QPen(QColor("#00d4ff"), 2, Qt.DashLine))
+        painter.drawRect(self.rect().adjusted(1, 1, -1, -1))
+        painter.end()
 
-            # Fond semi-transparent cyan
-            painter.setBrush(QBrush(QColor(0, 212, 255, 50)))
-            painter.setPen(QPen(QColor("#00d4ff"), 2, Qt.DashLine))
-            painter.drawRect(self.rect)
 
-            painter.end()
+class _AnalysisCancelled(Exception):
+    """Exception interne pour interrompre l'analyse audio"""
+    pass
 
 
 class LightTimelineEditor(QDialog):
@@ -195,8 +187,10 @@ class LightTimelineEditor(QDialog):
         self.history_index = -1
         self._saved_history_index = -1  # index au moment du dernier save_sequence
 
-        # Mode cut
+        # Mode cut (curseurs partages entre la fenetre et toutes les pistes)
         self.cut_mode = False
+        self._cut_cursor = QCursor(Qt.SplitHCursor)
+        self._arrow_cursor = QCursor(Qt.ArrowCursor)
 
         # Selection multi-pistes (rubber band)
         self.rubber_band_active = False
@@ -321,10 +315,10 @@ class LightTimelineEditor(QDialog):
 
         layout.addWidget(outer_splitter, 1)
 
-        # Creer l'overlay pour le rubber band (rectangle de selection visible)
-        self.rubber_band_overlay = RubberBandOverlay(self.tracks_scroll.viewport())
-        self.rubber_band_overlay.setGeometry(self.tracks_scroll.viewport().rect())
-        self.rubber_band_overlay.hide()
+        # Rubber band natif Qt (rectangle de selection visible) : se deplace
+        # sans forcer le repaint de tout le viewport des pistes
+        self.rubber_band = _SelectionBand(self.tracks_scroll.viewport())
+        self.rubber_band.hide()
 
         # Synchroniser ruler avec scroll horizontal
         self.tracks_scroll.horizontalScrollBar().valueChanged.connect(self.on_scroll_changed)
@@ -2430,19 +2424,15 @@ class LightTimelineEditor(QDialog):
         """Active/desactive le mode CUT avec curseur visuel"""
         self.cut_mode = not self.cut_mode
 
+        # Curseur ciseaux en mode CUT, curseur normal sinon, sur toute la
+        # fenetre et les pistes (sans re-appliquer un curseur deja en place)
+        cursor = self._cut_cursor if self.cut_mode else self._arrow_cursor
+        shape = cursor.shape()
+        for widget in (self, self.track_waveform, *self.tracks):
+            if widget.cursor().shape() != shape:
+                widget.setCursor(cursor)
         if self.cut_mode:
-            # Curseur ciseaux sur toute la fenetre et les pistes
-            self.setCursor(Qt.SplitHCursor)
-            for track in self.tracks:
-                track.setCursor(Qt.SplitHCursor)
-            self.track_waveform.setCursor(Qt.SplitHCursor)
-            print("✂️ Mode CUT active - Cliquez sur un clip pour le couper")
-        else:
-            # Restaurer curseur normal
-            self.setCursor(Qt.ArrowCursor)
-            for track in self.tracks:
-                track.setCursor(Qt.ArrowCursor)
-            self.track_waveform.setCursor(Qt.ArrowCursor)
+            log.debug("Mode CUT active - Cliquez sur un clip pour le couper")
 
     def clear_all_selections(self):
         """Deselectionne tous les clips sur toutes les pistes"""
@@ -2458,10 +2448,10 @@ class LightTimelineEditor(QDialog):
         self.rubber_band_rect = None
         self.clear_all_selections()
 
-        # Afficher et redimensionner l'overlay
-        self.rubber_band_overlay.setGeometry(self.tracks_scroll.viewport().rect())
-        self.rubber_band_overlay.show()
-        self.rubber_band_overlay.raise_()
+        # Afficher le rubber band (taille nulle au point de depart)
+        start_in_viewport = self.tracks_scroll.viewport().mapFrom(self, pos)
+        self.rubber_band.setGeometry(QRect(start_in_viewport, QSize()))
+        self.rubber_band.show()
 
     def update_rubber_band(self, current_pos):
         """Met a jour le rectangle de selection avec overlay visible"""
@@ -2480,30 +2470,39 @@ class LightTimelineEditor(QDialog):
 
         self.rubber_band_rect = QRect(x1, y1, x2 - x1, y2 - y1)
 
-        # Mettre a jour l'overlay
-        self.rubber_band_overlay.set_rect(self.rubber_band_rect)
+        # Mettre a jour le rubber band
+        self.rubber_band.setGeometry(self.rubber_band_rect)
 
         # Selectionner les clips dans le rectangle sur TOUTES les pistes
         scroll_offset = self.tracks_scroll.horizontalScrollBar().value()
         v_scroll_offset = self.tracks_scroll.verticalScrollBar().value()
         pixels_per_ms = 0.05 * self.current_zoom
+        # Origine X des clips dans le viewport (marge des labels - scroll)
+        base_x = 145 - scroll_offset
+
+        # Test d'intersection en entiers (meme semantique que QRect.intersects,
+        # sans allouer de QRect par clip) ; un rectangle nul ne touche rien
+        rb_null = x2 == x1 and y2 == y1
 
         for track in self.tracks:
             # Position Y de la piste dans le conteneur
-            track_y_in_container = track.mapTo(self.tracks_container, QPoint(0, 0)).y()
+            track_y_in_container = track.mapTo(self.tracks_container, _ORIGIN).y()
             # Position Y dans le viewport (avec scroll)
             track_y_in_viewport = track_y_in_container - v_scroll_offset
 
             track.selected_clips.clear()
 
+            # Bande verticale des clips de la piste : [y + 10, y + 50[
+            clip_y1 = track_y_in_viewport + 10
+            if rb_null or not (clip_y1 < y2 and y1 < clip_y1 + 40):
+                track.update()
+                continue
+
             for clip in track.clips:
-                clip_x = 145 + int(clip.start_time * pixels_per_ms) - scroll_offset
+                clip_x = base_x + int(clip.start_time * pixels_per_ms)
                 clip_width = int(clip.duration * pixels_per_ms)
 
-                # Rectangle du clip dans le viewport
-                clip_rect = QRect(clip_x, track_y_in_viewport + 10, clip_width, 40)
-
-                if self.rubber_band_rect.intersects(clip_rect):
+                if clip_x < x2 and x1 < clip_x + clip_width:
                     track.selected_clips.append(clip)
 
             track.update()
@@ -2515,14 +2514,13 @@ class LightTimelineEditor(QDialog):
         self.rubber_band_rect = None
         self.rubber_band_origin_track = None
 
-        # Cacher l'overlay
-        self.rubber_band_overlay.clear()
-        self.rubber_band_overlay.hide()
+        # Cacher le rubber band
+        self.rubber_band.hide()
 
         # Compter les clips selectionnes
         total = sum(len(track.selected_clips) for track in self.tracks)
         if total > 0:
-            print(f"📦 {total} clip(s) selectionne(s) sur plusieurs pistes")
+            log.debug("%d clip(s) selectionne(s) sur plusieurs pistes", total)
 
     def mousePressEvent(self, event):
         """Gere le clic pour demarrer le rubber band si dans la zone des pistes"""
@@ -2537,10 +2535,9 @@ class LightTimelineEditor(QDialog):
                 self.rubber_band_start = event.pos()
                 self.clear_all_selections()
 
-                # Preparer l'overlay
-                self.rubber_band_overlay.setGeometry(viewport.rect())
-                self.rubber_band_overlay.show()
-                self.rubber_band_overlay.raise_()
+                # Preparer le rubber band
+                self.rubber_band.setGeometry(QRect(pos_in_viewport, QSize()))
+                self.rubber_band.show()
                 return
 
         super().mousePressEvent(event)
@@ -3,29 +3,71 @@ Composants UI pour le controleur AKAI
 DualColorButton, EffectButton, FaderButton, ApcFader
 """
 import json
+import logging
 from pathlib import Path
 from i18n import tr
 from PySide6.QtWidgets import (
     QPushButton, QWidget, QMenu, QWidgetAction, QLabel, QHBoxLayout,
     QDoubleSpinBox, QLineEdit, QSizePolicy,
 )
-from PySide6.QtCore import Qt, QPoint, Signal, QTimer
-from PySide6.QtGui import QColor, QPainter, QPen, QPolygon
+from PySide6.QtCore import Qt, QEvent, QPoint, QRect, QRectF, Signal, QTimer
+from PySide6.QtGui import QAction, QBrush, QColor, QPainter, QPainterPath, QPen, QPixmap, QPolygon
+
+log = logging.getLogger("maestro.ui")
+
+# Effets de l'editeur : importes une fois (pas a chaque clic droit)
+try:
+    from effect_editor import custom_effects_mtime, load_all_effects
+except Exception:
+    log.warning("Effets de l'editeur indisponibles", exc_info=True)
+    custom_effects_mtime = load_all_effects = None
 
 
 class DualColorButton(QPushButton):
     """Bouton avec deux couleurs en diagonale"""
 
+    # Rendus deja rasterises, partages entre tous les pads :
+    # (rgb1, rgb2, brightness%, active, dpr) -> QPixmap
+    _PIX_CACHE = {}
+    _PIX_CACHE_MAX = 256
+
+    # Triangles fixes (haut gauche / bas droite) du pad 28x28
+    _POLY1 = QPolygon([QPoint(0, 0), QPoint(28, 0), QPoint(0, 28)])
+    _POLY2 = QPolygon([QPoint(28, 0), QPoint(28, 28), QPoint(0, 28)])
+
     def __init__(self, color1, color2):
         super().__init__()
         self.color1 = color1
         self.color2 = color2
         self.setFixedSize(28, 28)
+        # Les deux triangles couvrent tout le widget : pas d'effacement prealable
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
         self.active = False
         self.brightness = 0.3  # 30% par defaut
 
     def paintEvent(self, event):
+        # Le rendu ne depend que de (couleurs, brightness, active) : on blitte
+        # un pixmap mis en cache au lieu de re-rasteriser les triangles
+        dpr = self.devicePixelRatioF()
+        key = (self.color1.rgb(), self.color2.rgb(), round(self.brightness * 100),
+               self.active, dpr)
+        pix = self._PIX_CACHE.get(key)
+        if pix is None:
+            if len(self._PIX_CACHE) >= self._PIX_CACHE_MAX:
+                self._PIX_CACHE.clear()
+            pix = self._render_pixmap(dpr)
+            self._PIX_CACHE[key] = pix
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, pix)
+        painter.end()
+
+    def _render_pixmap(self, dpr):
+        """Rasterise le bouton dans un pixmap 28x28"""
+        pix = QPixmap(int(28 * dpr), int(28 * dpr))
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(Qt.transparent)
+        painter = QPainter(pix)
         painter.setRenderHint(QPainter.Antialiasing)
 
         # Calculer les couleurs avec brightness
@@ -43,13 +85,11 @@ class DualColorButton(QPushButton):
         # Diagonale couleur 1 (haut gauche)
         painter.setPen(Qt.NoPen)
         painter.setBrush(c1)
-        points1 = [QPoint(0, 0), QPoint(28, 0), QPoint(0, 28)]
-        painter.drawPolygon(QPolygon(points1))
+        painter.drawConvexPolygon(self._POLY1)
 
         # Diagonale couleur 2 (bas droite)
         painter.setBrush(c2)
-        points2 = [QPoint(28, 0), QPoint(28, 28), QPoint(0, 28)]
-        painter.drawPolygon(QPolygon(points2))
+        painter.drawConvexPolygon(self._POLY2)
 
         # Bordure
         if self.active:
@@ -58,10 +98,12 @@ class DualColorButton(QPushButton):
             painter.setPen(pen)
             painter.setBrush(Qt.NoBrush)
             painter.drawRoundedRect(1, 1, 26, 26, 4, 4)
+        painter.end()
+        return pix
 
 
 def _effect_presets():
-    return [
+    return (
         (tr("uic_effect_none"),         None,           "#2a2a2a"),
         ("⚡ Strobe",                   "Strobe",        "#ffffff"),
         ("💥 Flash",                    "Flash",         "#ffff00"),
@@ -73,22 +115,42 @@ def _effect_presets():
         ("🔥 Feu",                      "Fire",          "#ff4400"),
         (tr("uic_effect_white_chase"),  "Chase",         "#e0e0e0"),
         (tr("uic_effect_bascule"),      "Bascule",       "#44ccff"),
-    ]
+    )
 
 EFFECT_PRESETS = _effect_presets()
 
 # Effet par defaut pour chaque bouton (index 0-8)
-DEFAULT_EFFECTS = [
+DEFAULT_EFFECTS = (
     "Strobe", "Flash", "Pulse", "Wave",
     "Comete", "Rainbow", "Etoile Filante", "Chase", "Pulse"
-]
+)
+
+# Index nom d'effet -> libelle / emoji (evite les parcours lineaires)
+_LABEL_BY_EFFECT = {name: label for label, name, _ in EFFECT_PRESETS}
+_EMOJI_BY_EFFECT = {name: label.split(" ")[0] for label, name, _ in EFFECT_PRESETS}
 
 def get_effect_emoji(effect_name):
     """Retourne l'emoji correspondant a un effet"""
-    for label, name, _ in EFFECT_PRESETS:
-        if name == effect_name:
-            return label.split(" ")[0]
-    return ""
+    return _EMOJI_BY_EFFECT.get(effect_name, "")
+
+
+# Effets du menu (builtin + custom), invalides quand le fichier custom change
+_EFFECTS_CACHE = {"mtime": None, "data": None}
+
+def _load_menu_effects():
+    """Charge tous les effets du menu : builtin + custom.
+    La liste fusionnee est reutilisee tant que le mtime du fichier des
+    effets personnalises ne change pas (pas de lecture disque ni de parsing)."""
+    if load_all_effects is None:
+        return []
+    mtime = custom_effects_mtime()
+    if _EFFECTS_CACHE["data"] is not None and _EFFECTS_CACHE["mtime"] == mtime:
+        return _EFFECTS_CACHE["data"]
+
+    all_effects = load_all_effects()
+    _EFFECTS_CACHE["mtime"] = mtime
+    _EFFECTS_CACHE["data"] = all_effects
+    return all_effects
 
 
 class EffectButton(QPushButton):
@@ -100,11 +162,76 @@ class EffectButton(QPushButton):
     released_signal        = Signal(int)          # (btn_index)  — release physique
     open_editor_requested  = Signal(int)          # (btn_index)  — ouvre l'éditeur d'effets
 
+    # Feuille de style unique, la variante est choisie par la propriete "state"
+    STYLE = """
+        QPushButton[state="active"] {
+            background: #33ff33;
+            border: 2px solid #ffffff;
+            border-radius: 3px;
+        }
+        QPushButton[state="idle"] {
+            background: #116611;
+            border: 1px solid #114411;
+            border-radius: 3px;
+        }
+        QPushButton[state="idle"]:hover {
+            background: #118811;
+        }
+    """
+
+    # Feuilles de style du menu contextuel, partagees par tous les boutons
+    MENU_STYLE = """
+        QMenu {
+            background: #1a1a1a;
+            border: 1px solid #3a3a3a;
+            padding: 4px;
+            font-size: 12px;
+        }
+        QMenu::item {
+            padding: 6px 16px;
+            border-radius: 3px;
+            color: #e0e0e0;
+        }
+        QMenu::item:selected { background: #2a3a3a; color: #fff; }
+        QMenu::item:disabled { color: #555; font-size: 10px; letter-spacing: 1px; }
+        QMenu::separator { background: #333; height: 1px; margin: 3px 8px; }
+    """
+    SEARCH_STYLE = """
+        QLineEdit {
+            background: #111;
+            color: #e0e0e0;
+            border: 1px solid #444;
+            border-radius: 4px;
+            padding: 4px 8px;
+            font-size: 12px;
+        }
+        QLineEdit:focus { border-color: #00d4ff; }
+    """
+    TRIG_MENU_STYLE = """
+        QMenu {
+            background: #1a1a1a;
+            border: 1px solid #3a3a3a;
+            padding: 4px;
+            font-size: 12px;
+        }
+        QMenu::item { padding: 6px 16px; border-radius: 3px; color: #e0e0e0; }
+        QMenu::item:selected { background: #2a3a3a; color: #fff; }
+        QMenu::item:checked { color: #00d4ff; }
+    """
+    DUR_LABEL_STYLE = "color: #aaa; font-size: 11px; background: transparent;"
+    DUR_SPIN_STYLE = (
+        "QDoubleSpinBox { background: #222; color: #fff; border: 1px solid #444;"
+        " border-radius: 3px; padding: 2px 4px; font-size: 11px; }"
+        "QDoubleSpinBox::up-button, QDoubleSpinBox::down-button"
+        " { width: 16px; background: #333; border: none; }"
+    )
+
     def __init__(self, index):
         super().__init__()
         self.index = index
         self.setFixedSize(16, 16)
         self.active = False
+        self._last_active = None          # etat applique au style (None = jamais)
         self.trigger_mode = "toggle"      # "toggle" | "flash" | "timer"
         self.trigger_duration = 2000      # ms, pour mode Timer
         # Effet par defaut selon la position
@@ -112,51 +239,38 @@ class EffectButton(QPushButton):
             self.current_effect = DEFAULT_EFFECTS[index]
         else:
             self.current_effect = None
+        self._menu = None                 # menu contextuel construit a la demande
+        self._menu_source = None
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_effects_menu)
         self.setToolTip(self._tooltip())
+        self.setStyleSheet(self.STYLE)
         self.update_style()
 
     def _tooltip(self):
         """Genere le tooltip avec emoji + nom de l'effet"""
         if not self.current_effect:
             return tr("uic_tooltip_no_effect")
-        for label, name, _ in EFFECT_PRESETS:
-            if name == self.current_effect:
-                return label
-        return self.current_effect
+        return _LABEL_BY_EFFECT.get(self.current_effect, self.current_effect)
 
     def show_effects_menu(self, pos):
-        """Affiche le menu des effets (chargés depuis l'éditeur d'effets)"""
-        # Charger tous les effets : builtin + custom
-        all_effects = []
-        try:
-            from effect_editor import BUILTIN_EFFECTS, _load_custom_effects
-            all_effects = list(BUILTIN_EFFECTS)
-            existing_names = {e["name"] for e in all_effects}
-            for e in _load_custom_effects():
-                if e.get("name") not in existing_names:
-                    all_effects.append(e)
-        except Exception:
-            pass
+        """Affiche le menu des effets (chargés depuis l'éditeur d'effets).
+        Le menu est construit une seule fois puis réutilisé ; il n'est
+        reconstruit que si la liste des effets a changé."""
+        all_effects = _load_menu_effects()
+        if self._menu is None or all_effects is not self._menu_source:
+            self._build_effects_menu(all_effects)
+        self._refresh_effects_menu()
+        # Focus automatique sur la barre de recherche à l'ouverture
+        QTimer.singleShot(0, self._menu_search.setFocus)
+        self._menu.exec(self.mapToGlobal(pos))
 
+    def _build_effects_menu(self, all_effects):
+        """Construit le menu des effets et garde les références à rafraîchir"""
+        if self._menu is not None:
+            self._menu.deleteLater()
         menu = QMenu(self)
-        menu.setStyleSheet("""
-            QMenu {
-                background: #1a1a1a;
-                border: 1px solid #3a3a3a;
-                padding: 4px;
-                font-size: 12px;
-            }
-            QMenu::item {
-                padding: 6px 16px;
-                border-radius: 3px;
-                color: #e0e0e0;
-            }
-            QMenu::item:selected { background: #2a3a3a; color: #fff; }
-            QMenu::item:disabled { color: #555; font-size: 10px; letter-spacing: 1px; }
-            QMenu::separator { background: #333; height: 1px; margin: 3px 8px; }
-        """)
+        menu.setStyleSheet(self.MENU_STYLE)
 
         # ── Barre de recherche ────────────────────────────────────────────────
         search_container = QWidget()
@@ -166,17 +280,7 @@ class EffectButton(QPushButton):
         search_input = QLineEdit()
         search_input.setPlaceholderText(tr("uic_search_effect_ph"))
         search_input.setClearButtonEnabled(True)
-        search_input.setStyleSheet("""
-            QLineEdit {
-                background: #111;
-                color: #e0e0e0;
-                border: 1px solid #444;
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 12px;
-            }
-            QLineEdit:focus { border-color: #00d4ff; }
-        """)
+        search_input.setStyleSheet(self.SEARCH_STYLE)
         # Empêcher les touches directionnelles de fermer le menu
         def _search_key(event):
             if event.key() in (Qt.Key_Up, Qt.Key_Down, Qt.Key_Return, Qt.Key_Enter):
@@ -190,27 +294,9 @@ class EffectButton(QPushButton):
         menu.addAction(search_wa)
         menu.addSeparator()
 
-        # Si current_effect est un nom de type legacy ("Strobe", "Chase"...) sans match
-        # exact dans la liste, on fait un fallback par type pour trouver le premier match
-        cur = self.current_effect
-        name_is_full_match = cur and any(e.get("name") == cur for e in all_effects)
-
-        def _is_checked(eff):
-            name = eff.get("name", "")
-            if name == cur:
-                return True
-            # Fallback : current_effect est un type legacy ("Strobe", "Flash"...)
-            if not name_is_full_match and cur and eff.get("type") == cur:
-                first_of_type = next(
-                    (e for e in all_effects if e.get("type") == cur), None
-                )
-                return first_of_type is not None and first_of_type.get("name") == name
-            return False
-
         # Option "Aucun"
         act_none = menu.addAction(tr("uic_menu_none"))
         act_none.setCheckable(True)
-        act_none.setChecked(not cur)
         act_none.triggered.connect(lambda: self._select_editor_effect(None))
         sep_top = menu.addSeparator()
 
@@ -232,35 +318,26 @@ class EffectButton(QPushButton):
         CATS = _CAT_KEYS
         # cat_groups : [(hdr_act, sep_act_before, [(eff_act, eff_name), ...])]
         cat_groups = []
+        effect_actions = []   # [(act, eff)] pour rafraîchir les coches
+        # Regroupement en une seule passe ; "other" = catégorie inconnue
+        by_cat = {cat: [] for cat in CATS}
+        other = []
+        for e in all_effects:
+            by_cat.get(e.get("category", ""), other).append(e)
         for cat in CATS:
-            cat_effs = [e for e in all_effects if e.get("category") == cat]
+            cat_effs = by_cat[cat]
             if not cat_effs:
                 continue
             cat_display = _CAT_LABELS.get(cat, cat)
             hdr = menu.addAction(f"  {cat_display.upper()}")
             hdr.setEnabled(False)
-            eff_actions = []
-            for eff in cat_effs:
-                name = eff.get("name", "")
-                act = menu.addAction(f"  {name}")
-                act.setCheckable(True)
-                act.setChecked(_is_checked(eff))
-                act.triggered.connect(lambda checked=False, e=dict(eff): self._select_editor_effect(e))
-                eff_actions.append((act, name))
+            eff_actions = self._make_effect_actions(menu, cat_effs, effect_actions)
             cat_groups.append((hdr, eff_actions))
 
         # Effets sans catégorie connue
-        other = [e for e in all_effects if e.get("category", "") not in CATS]
         if other:
             sep_other = menu.addSeparator()
-            other_actions = []
-            for eff in other:
-                name = eff.get("name", "")
-                act = menu.addAction(f"  {name}")
-                act.setCheckable(True)
-                act.setChecked(_is_checked(eff))
-                act.triggered.connect(lambda checked=False, e=dict(eff): self._select_editor_effect(e))
-                other_actions.append((act, name))
+            other_actions = self._make_effect_actions(menu, other, effect_actions)
             cat_groups.append((sep_other, other_actions))
 
         # ── Filtrage dynamique ────────────────────────────────────────────────
@@ -279,40 +356,24 @@ class EffectButton(QPushButton):
                 hdr_act.setVisible(any_visible)
 
         search_input.textChanged.connect(_apply_filter)
-        # Focus automatique sur la barre de recherche à l'ouverture
-        QTimer.singleShot(0, search_input.setFocus)
+        # Un seul slot pour toutes les actions d'effet (dispatch par index)
+        menu.triggered.connect(self._on_effects_menu_triggered)
 
         # ── Sous-menu Mode de déclenchement ──────────────────────────────────
         menu.addSeparator()
         trig_menu = menu.addMenu(tr("uic_trigger_mode_menu"))
-        trig_menu.setStyleSheet("""
-            QMenu {
-                background: #1a1a1a;
-                border: 1px solid #3a3a3a;
-                padding: 4px;
-                font-size: 12px;
-            }
-            QMenu::item { padding: 6px 16px; border-radius: 3px; color: #e0e0e0; }
-            QMenu::item:selected { background: #2a3a3a; color: #fff; }
-            QMenu::item:checked { color: #00d4ff; }
-        """)
-
-        def _trig_checked(mode):
-            return self.trigger_mode == mode
+        trig_menu.setStyleSheet(self.TRIG_MENU_STYLE)
 
         act_tog = trig_menu.addAction(tr("uic_trigger_toggle"))
         act_tog.setCheckable(True)
-        act_tog.setChecked(_trig_checked("toggle"))
         act_tog.triggered.connect(lambda: self._set_trigger_mode("toggle"))
 
         act_fla = trig_menu.addAction(tr("uic_trigger_flash"))
         act_fla.setCheckable(True)
-        act_fla.setChecked(_trig_checked("flash"))
         act_fla.triggered.connect(lambda: self._set_trigger_mode("flash"))
 
         act_tim = trig_menu.addAction(tr("uic_trigger_timer"))
         act_tim.setCheckable(True)
-        act_tim.setChecked(_trig_checked("timer"))
         act_tim.triggered.connect(lambda: self._set_trigger_mode("timer"))
 
         # Durée du timer (QWidgetAction avec spinbox)
@@ -322,19 +383,13 @@ class EffectButton(QPushButton):
         dur_layout.setContentsMargins(16, 4, 16, 4)
         dur_layout.setSpacing(6)
         dur_lbl = QLabel(tr("uic_duration_label"))
-        dur_lbl.setStyleSheet("color: #aaa; font-size: 11px; background: transparent;")
+        dur_lbl.setStyleSheet(self.DUR_LABEL_STYLE)
         dur_spin = QDoubleSpinBox()
         dur_spin.setRange(0.1, 60.0)
         dur_spin.setSingleStep(0.5)
-        dur_spin.setValue(self.trigger_duration / 1000.0)
         dur_spin.setSuffix(" s")
         dur_spin.setFixedWidth(80)
-        dur_spin.setStyleSheet(
-            "QDoubleSpinBox { background: #222; color: #fff; border: 1px solid #444;"
-            " border-radius: 3px; padding: 2px 4px; font-size: 11px; }"
-            "QDoubleSpinBox::up-button, QDoubleSpinBox::down-button"
-            " { width: 16px; background: #333; border: none; }"
-        )
+        dur_spin.setStyleSheet(self.DUR_SPIN_STYLE)
         dur_spin.valueChanged.connect(
             lambda v: self._set_trigger_duration(int(v * 1000))
         )
@@ -349,7 +404,65 @@ class EffectButton(QPushButton):
         act_editor = menu.addAction(tr("uic_effect_editor_menu"))
         act_editor.triggered.connect(lambda: self.open_editor_requested.emit(self.index))
 
-        menu.exec(self.mapToGlobal(pos))
+        self._menu = menu
+        self._menu_source = all_effects
+        self._menu_search = search_input
+        self._menu_act_none = act_none
+        self._menu_effect_actions = effect_actions
+        self._menu_trig_actions = {"toggle": act_tog, "flash": act_fla, "timer": act_tim}
+        self._menu_dur_spin = dur_spin
+
+    @staticmethod
+    def _make_effect_actions(menu, effects, effect_actions):
+        """Cree les actions cochables d'un groupe d'effets et les ajoute au menu
+        en une fois. data() = index dans effect_actions. Retourne [(act, name)]."""
+        group = []
+        batch = []
+        for eff in effects:
+            name = eff.get("name", "")
+            act = QAction(f"  {name}", menu)
+            act.setCheckable(True)
+            act.setData(len(effect_actions))
+            effect_actions.append((act, eff))
+            group.append((act, name))
+            batch.append(act)
+        menu.addActions(batch)
+        return group
+
+    def _on_effects_menu_triggered(self, action):
+        """Applique l'effet correspondant a une action du menu"""
+        idx = action.data()
+        if isinstance(idx, int) and 0 <= idx < len(self._menu_effect_actions):
+            self._select_editor_effect(self._menu_effect_actions[idx][1])
+
+    def _refresh_effects_menu(self):
+        """Met à jour coches, recherche et durée du menu avant affichage"""
+        self._menu_search.clear()
+
+        # Si current_effect est un nom de type legacy ("Strobe", "Chase"...) sans match
+        # exact dans la liste, on fait un fallback par type pour trouver le premier match
+        cur = self.current_effect
+        all_effects = self._menu_source
+        name_is_full_match = cur and any(e.get("name") == cur for e in all_effects)
+        fallback_name = None
+        if cur and not name_is_full_match:
+            first_of_type = next((e for e in all_effects if e.get("type") == cur), None)
+            if first_of_type is not None:
+                fallback_name = first_of_type.get("name")
+
+        self._menu_act_none.setChecked(not cur)
+        for act, eff in self._menu_effect_actions:
+            name = eff.get("name", "")
+            act.setChecked(name == cur or (fallback_name is not None
+                                           and eff.get("type") == cur
+                                           and name == fallback_name))
+
+        for mode, act in self._menu_trig_actions.items():
+            act.setChecked(self.trigger_mode == mode)
+        self._menu_dur_spin.blockSignals(True)
+        self._menu_dur_spin.setValue(self.trigger_duration / 1000.0)
+        self._menu_dur_spin.blockSignals(False)
+
 
     def _set_trigger_mode(self, mode: str):
         self.trigger_mode = mode
@@ -391,61 +504,59 @@ class EffectButton(QPushButton):
             self.active = False
         self.setToolTip(self._tooltip())
         self.update_style()
-        print(f"Effet {self.index}: {effect}")
+        log.debug("Effet %s: %s", self.index, effect)
 
     def update_style(self):
-        if self.active:
-            self.setStyleSheet("""
-                QPushButton {
-                    background: #33ff33;
-                    border: 2px solid #ffffff;
-                    border-radius: 3px;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QPushButton {
-                    background: #116611;
-                    border: 1px solid #114411;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background: #118811;
-                }
-            """)
+        # Re-polish uniquement si l'etat a change
+        if self._last_active == self.active:
+            return
+        self._last_active = self.active
+        self.setProperty("state", "active" if self.active else "idle")
+        self.style().unpolish(self)
+        self.style().polish(self)
+        self.update()
 
 
 class FaderButton(QPushButton):
     """Bouton mute au-dessus du fader"""
 
+    # Feuille de style unique, la variante est choisie par la propriete "state"
+    STYLE = """
+        QPushButton[state="active"] {
+            background: #ff0000;
+            border: 2px solid #ff3333;
+            border-radius: 3px;
+        }
+        QPushButton[state="idle"] {
+            background: #440000;
+            border: 1px solid #660000;
+            border-radius: 3px;
+        }
+        QPushButton[state="idle"]:hover {
+            background: #660000;
+        }
+    """
+
     def __init__(self, index, callback):
         super().__init__()
         self.index = index
         self.callback = callback
         self.setFixedSize(16, 16)
         self.active = False
+        self._last_active = None          # etat applique au style (None = jamais)
+        self.setStyleSheet(self.STYLE)
         self.update_style()
 
     def update_style(self):
-        if self.active:
-            self.setStyleSheet("""
-                QPushButton {
-                    background: #ff0000;
-                    border: 2px solid #ff3333;
-                    border-radius: 3px;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QPushButton {
-                    background: #440000;
-                    border: 1px solid #660000;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background: #660000;
-                }
-            """)
+        # Re-polish uniquement si l'etat a change
+        if self._last_active == self.active:
+            return
+        self._last_active = self.active
+        self.setProperty("state", "active" if self.active else "idle")
+        self.style().unpolish(self)
+        self.style().polish(self)
+        self.update()
+
 
     def mousePressEvent(self, e):
         self.active = not self.active
@@ -457,6 +568,9 @@ class FaderButton(QPushButton):
 class ApcFader(QWidget):
     """Fader style AKAI APC"""
 
+    GROOVE_COLOR = QColor("#333")
+    KNOB_COLOR = QColor("#ffffff")
+
     def __init__(self, index, callback, vertical=True, label=""):
         super().__init__()
         self.index = index
@@ -469,42 +583,124 @@ class ApcFader(QWidget):
             self.setMinimumHeight(200)
         else:
             self.setFixedSize(26, 110)
+        self._update_geometry()
+        # Pendant un drag, le callback est emis au plus une fois par frame
+        self._pending_value = None
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(16)
+        self._emit_timer.timeout.connect(self._flush_callback)
+
+    def _update_geometry(self):
+        """Precalcule la geometrie du rail et du curseur (invariante entre resizes)"""
+        w, h = self.width(), self.height()
+        if not self.vertical:
+            self._groove_rect = QRect(w//2 - 2, 6, 4, h - 12)
+            self._knob_x, self._knob_w, self._knob_h = 2, 22, 10
+            self._knob_radius = 2
+            self._knob_top = h - 15          # y du curseur a la valeur 0
+            self._value_base = h - 15        # y correspondant a la valeur 0
+            self._knob_range = h - 25        # course du curseur en pixels
+        else:
+            self._groove_rect = QRect(w//2 - 2, 15, 4, h - 30)
+            self._knob_x, self._knob_w, self._knob_h = w//2 - 15, 30, 12
+            self._knob_radius = 3
+            self._knob_top = h - 20
+            self._value_base = h - 30
+            self._knob_range = h - 45
+        self._y_max = h - 10
+        self._bg_pixmap = None            # rail, re-rasterise au prochain paint
+
+    def _render_background(self, dpr):
+        """Rasterise le rail (fixe entre deux resizes) sur fond transparent :
+        le fond reste celui du parent, quel qu'il soit"""
+        pm = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.transparent)
+        p = QPainter(pm)
+        p.setRenderHint(QPainter.Antialiasing)
+        # Meme contour que QPainter(widget) : couleur de premier plan du widget
+        p.setPen(self.palette().color(self.foregroundRole()))
+        p.setBrush(self.GROOVE_COLOR)
+        p.drawRoundedRect(self._groove_rect, 2, 2)
+        p.end()
+        return pm
+
+    def resizeEvent(self, e):
+        self._update_geometry()
+        super().resizeEvent(e)
+
+    def changeEvent(self, e):
+        # Le contour du rail suit la palette (feuille de style du parent)
+        if e.type() in (QEvent.PaletteChange, QEvent.StyleChange):
+            self._bg_pixmap = None
+        super().changeEvent(e)
 
     def paintEvent(self, _):
+        dpr = self.devicePixelRatioF()
+        if self._bg_pixmap is None or self._bg_pixmap.devicePixelRatio() != dpr:
+            self._bg_pixmap = self._render_background(dpr)
         p = QPainter(self)
+        p.drawPixmap(0, 0, self._bg_pixmap)
         p.setRenderHint(QPainter.Antialiasing)
-        w, h = self.width(), self.height()
-        p.setBrush(QColor("#333"))
-        if not self.vertical:
-            p.drawRoundedRect(w//2 - 2, 6, 4, h - 12, 2, 2)
-            pos = h - 15 - int((self.value / 100) * (h - 25))
-            p.setBrush(QColor("#ffffff"))
-            p.drawRoundedRect(2, pos, 22, 10, 2, 2)
-        else:
-            p.drawRoundedRect(w//2 - 2, 15, 4, h - 30, 2, 2)
-            pos = h - 30 - int((self.value / 100) * (h - 45))
-            p.setBrush(QColor("#ffffff"))
-            p.drawRoundedRect(w//2 - 15, pos + 10, 30, 12, 3, 3)
+        p.setBrush(self.KNOB_COLOR)
+        p.drawRoundedRect(self._knob_rect(self.value), self._knob_radius, self._knob_radius)
+
+    def _knob_rect(self, value):
+        """Rectangle du curseur pour une valeur donnee (0-100)"""
+        pos = self._knob_top - int((value / 100) * self._knob_range)
+        return QRect(self._knob_x, pos, self._knob_w, self._knob_h)
 
     def mousePressEvent(self, e):
         self.update_value(e.position())
+        self._flush_callback()
 
     def mouseMoveEvent(self, e):
         self.update_value(e.position())
 
+    def mouseReleaseEvent(self, e):
+        self._flush_callback()
+        super().mouseReleaseEvent(e)
+
+    def _flush_callback(self):
+        """Transmet la derniere valeur en attente au callback"""
+        self._emit_timer.stop()
+        if self._pending_value is None:
+            return
+        value = self._pending_value
+        self._pending_value = None
+        self.callback(self.index, value)
+
     def update_value(self, pos):
-        limit = self.height() - (45 if self.vertical else 25)
-        offset = 30 if self.vertical else 15
-        y = max(10, min(self.height() - 10, int(pos.y())))
-        self.value = int((self.height() - offset - y) / limit * 100)
-        self.value = max(0, min(100, self.value))
-        self.callback(self.index, self.value)
-        self.update()
+        y = max(10, min(self._y_max, int(pos.y())))
+        new_value = int((self._value_base - y) / self._knob_range * 100)
+        new_value = max(0, min(100, new_value))
+        if new_value == self.value:
+            return
+        old_value = self.value
+        self.value = new_value
+        self._pending_value = new_value
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
+        self._update_knob(old_value)
 
     def set_value(self, value):
         """Definit la valeur du fader (0-100)"""
-        self.value = max(0, min(100, value))
-        self.update()
+        value = max(0, min(100, value))
+        if value == self.value:
+            return
+        old_value = self.value
+        self.value = value
+        self._update_knob(old_value)
+
+    def _update_knob(self, old_value):
+        """Repeint uniquement l'ancienne et la nouvelle position du curseur,
+        et rien du tout si le curseur n'a pas bouge d'un pixel"""
+        old_rect = self._knob_rect(old_value)
+        new_rect = self._knob_rect(self.value)
+        if old_rect == new_rect:
+            return
+        self.update(old_rect.united(new_rect).adjusted(-1, -1, 1, 1))
 
 
 class CartoucheButton(QPushButton):
@@ -521,6 +717,13 @@ class CartoucheButton(QPushButton):
         QColor("#00d4ff"),
     ]
 
+    # (lecture, survol, rgb de base) -> (fond, (haut, droite, bas), accent, texte)
+    _COLOR_CACHE = {}
+
+    # Police fixee au niveau du widget : une regle font-size d'un parent
+    # (QWidget { font-size: 10pt } de MainWindow) ne doit pas l'ecraser
+    STYLE = "QPushButton { font: bold 11px; }"
+
     VIDEO_EXTS = {'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm'}
     AUDIO_EXTS = {'.mp3', '.wav', '.ogg', '.flac', '.aac', '.wma'}
 
@@ -530,6 +733,10 @@ class CartoucheButton(QPushButton):
         self.callback = callback
         self.state = self.IDLE
         self.base_color = self.COLORS[index % len(self.COLORS)]
+        # Brosses semi-transparentes de la barre de volume (fixes)
+        self._bar_brush_on = QBrush(QColor(self.base_color.red(), self.base_color.green(),
+                                           self.base_color.blue(), 160))
+        self._bar_brush_off = QBrush(QColor(0x55, 0x55, 0x55, 160))
         self.media_path = None
         self.media_title = None
         self.media_icon = ""
@@ -538,61 +745,30 @@ class CartoucheButton(QPushButton):
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.setCursor(Qt.PointingHandCursor)
         self.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.setStyleSheet(self.STYLE)
         self._update_style()
 
-    def _update_style(self):
-        r = self.base_color.red()
-        g = self.base_color.green()
-        b = self.base_color.blue()
-        hex_col = self.base_color.name()
-
+    def _label_text(self):
         if self.media_title:
             label = f"{self.media_icon} {self.media_title}" if self.media_icon else self.media_title
         else:
             label = tr("uic_cartouche_label", n=self.index + 1)
         vol_str = f"   {self.volume}%" if self.volume < 100 else ""
-        self.setText(label + vol_str)
-
-        if self.state == self.PLAYING:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background: rgba({r},{g},{b},18);
-                    border-left: 3px solid rgba({r},{g},{b},255);
-                    border-top: 1px solid rgba({r},{g},{b},60);
-                    border-right: 1px solid rgba({r},{g},{b},20);
-                    border-bottom: 1px solid rgba({r},{g},{b},40);
-                    border-radius: 4px;
-                    color: rgba({r},{g},{b},255);
-                    font-weight: bold;
-                    font-size: 11px;
-                    padding: 4px 8px 4px 10px;
-                    text-align: left;
-                }}
-                QPushButton:hover {{
-                    background: rgba({r},{g},{b},28);
-                }}
-            """)
-        else:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background: #111111;
-                    border-left: 3px solid rgba({r},{g},{b},120);
-                    border-top: 1px solid #1e1e1e;
-                    border-right: 1px solid #1a1a1a;
-                    border-bottom: 1px solid #1e1e1e;
-                    border-radius: 4px;
-                    color: #888888;
-                    font-weight: bold;
-                    font-size: 11px;
-                    padding: 4px 8px 4px 10px;
-                    text-align: left;
-                }}
-                QPushButton:hover {{
-                    background: #161616;
-                    border-left: 3px solid rgba({r},{g},{b},200);
-                    color: #bbbbbb;
-                }}
-            """)
+        return label + vol_str
+
+    def _update_style(self):
+        self.setText(self._label_text())
+        self.update()
+
+    def set_volume(self, volume):
+        """Change le volume (0-100) en ne repeignant que la bande de la barre"""
+        volume = max(0, min(100, int(volume)))
+        if volume == self.volume:
+            return
+        self.volume = volume
+        # setText ne declenche un repaint complet que si le libelle change
+        self.setText(self._label_text())
+        self.update(QRect(2, self.height() - 4, self.width() - 4, 4))
 
     def set_idle(self):
         self.state = self.IDLE
@@ -606,17 +782,86 @@ class CartoucheButton(QPushButton):
         self.state = self.STOPPED
         self._update_style()
 
+    def enterEvent(self, event):
+        super().enterEvent(event)
+        self.update()
+
+    def leaveEvent(self, event):
+        super().leaveEvent(event)
+        self.update()
+
+    def _paint_colors(self, playing, hover):
+        """Couleurs (fond, bordures, accent, texte) pour un etat, mises en cache
+        par (lecture, survol, couleur de base)"""
+        key = (playing, hover, self.base_color.rgb())
+        colors = self._COLOR_CACHE.get(key)
+        if colors is None:
+            r = self.base_color.red()
+            g = self.base_color.green()
+            b = self.base_color.blue()
+            if playing:
+                colors = (
+                    QColor(r, g, b, 28 if hover else 18),
+                    (QColor(r, g, b, 60), QColor(r, g, b, 20), QColor(r, g, b, 40)),
+                    QColor(r, g, b, 255),
+                    QColor(r, g, b, 255),
+                )
+            else:
+                colors = (
+                    QColor("#161616" if hover else "#111111"),
+                    (QColor("#1e1e1e"), QColor("#1a1a1a"), QColor("#1e1e1e")),
+                    QColor(r, g, b, 200 if hover else 120),
+                    QColor("#bbbbbb" if hover else "#888888"),
+                )
+            self._COLOR_CACHE[key] = colors
+        return colors
+
     def paintEvent(self, event):
-        super().paintEvent(event)
-        # Barre de volume en bas du bouton
+        # Un seul QPainter : fond, bordure gauche, texte et barre de volume
         painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
         w = self.width()
         h = self.height()
+        bg, border, accent, fg = self._paint_colors(self.state == self.PLAYING,
+                                                    self.underMouse())
+
+        # Fond
+        frame = QPainterPath()
+        frame.addRoundedRect(QRectF(0.5, 0.5, w - 1, h - 1), 4, 4)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(bg)
+        painter.drawPath(frame)
+
+        # Bordures fines haut / droite / bas, chacune avec sa couleur
+        # (les coins arrondis vont au haut et au bas)
+        top, right, bottom = border
+        painter.setBrush(Qt.NoBrush)
+        for clip, color in ((QRect(0, 0, w, 4), top),
+                            (QRect(w - 4, 4, 4, h - 8), right),
+                            (QRect(0, h - 4, w, 4), bottom)):
+            painter.save()
+            painter.setClipRect(clip)
+            painter.setPen(QPen(color, 1))
+            painter.drawPath(frame)
+            painter.restore()
+
+        # Bordure gauche 3px (clippee sur le cadre arrondi)
+        painter.save()
+        painter.setClipPath(frame)
+        painter.fillRect(0, 0, 3, h, accent)
+        painter.restore()
+
+        # Texte : bordure + padding (3+10px a gauche, 1+8px a droite, 1+4px en haut/bas)
+        text_rect = self.rect().adjusted(13, 5, -9, -5)
+        text = self.fontMetrics().elidedText(self.text(), Qt.ElideRight, text_rect.width())
+        painter.setPen(fg)
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, text)
+
+        # Barre de volume en bas du bouton
         bar_h = 3
         bar_w = int((w - 4) * self.volume / 100)
-        color = self.base_color if self.volume > 0 else QColor("#555")
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor(color.red(), color.green(), color.blue(), 160))
+        painter.setBrush(self._bar_brush_on if self.volume > 0 else self._bar_brush_off)
         painter.drawRoundedRect(2, h - bar_h - 1, bar_w, bar_h, 1, 1)
         painter.end()
 
@@ -7,22 +7,19 @@ Systeme de mise a jour et ecran de chargement pour MyStrow
 - AkaiSplashEffect : animation LED sur l'AKAI APC mini pendant le splash
 """
 import os
+import re
 import sys
-import json
-import hashlib
-import tempfile
-import subprocess
-import ssl
-import urllib.request
+import time
 import random
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel,
     QPushButton, QProgressBar, QDialog, QMessageBox, QApplication, QFrame
 )
-from PySide6.QtCore import Qt, QThread, Signal, QTimer, QUrl, QRect
+from PySide6.QtCore import Qt, QThread, QThreadPool, Signal, QTimer, QUrl, QRect
 from PySide6.QtGui import (
     QFont, QScreen, QPixmap, QDesktopServices,
     QColor, QPainter
@@ -35,6 +32,7 @@ from i18n import get_language, set_language, tr
 def _make_ssl_context():
     """Contexte SSL compatible Mac/Windows/PyInstaller.
     Priorité : certifi (bundlé) → contexte système → non vérifié (dernier recours)."""
+    import ssl
     try:
         import certifi
         return ssl.create_default_context(cafile=certifi.where())
@@ -45,24 +43,108 @@ def _make_ssl_context():
     except Exception:
         return ssl._create_unverified_context()
 
+
+_SSL_CTX = None
+_OPENER  = None
+
+def _get_opener():
+    """Opener urllib partagé par le checker et le téléchargement.
+    Le contexte SSL (chargement des certificats) n'est construit qu'une fois,
+    au premier appel réseau plutôt qu'à l'import."""
+    global _SSL_CTX, _OPENER
+    if _OPENER is None:
+        import urllib.request
+        _SSL_CTX = _make_ssl_context()
+        _OPENER = urllib.request.build_opener(urllib.request.HTTPSHandler(context=_SSL_CTX))
+    return _OPENER
+
 # === CONSTANTES ===
 _GITHUB_REPO       = "nprieto-ext/MAESTRO"
 _UPDATE_API_URL    = f"https://api.github.com/repos/{_GITHUB_REPO}/releases/latest"
 _RELEASES_LATEST   = f"https://github.com/{_GITHUB_REPO}/releases/latest"
 REMINDER_FILE      = Path.home() / ".maestro_update_reminder.json"
+UPDATE_CACHE_FILE  = Path.home() / ".maestro_update_cache.json"
+_UPDATE_CACHE_TTL  = 600   # s : version distante reutilisee sans appel reseau
+_LOGO_PATH         = resource_path("logo.png")
 
+# hauteur -> QPixmap du logo deja redimensionne (None si logo absent)
+_LOGO_CACHE = {}
 
-def _version_tuple(v):
-    """Convertit '2.5.0' en (2, 5, 0) pour comparaison"""
+
+@lru_cache(maxsize=16)
+def _font(family, size, weight=None):
+    """QFont partage (implicitement partage par Qt : setFont en fait une copie).
+    Ne pas modifier l'objet retourne."""
+    if weight is None:
+        return QFont(family, size)
+    return QFont(family, size, weight)
+
+
+def _logo_pixmap(height):
+    """Logo redimensionne a la hauteur voulue, decode et mis a l'echelle une seule fois"""
+    if height not in _LOGO_CACHE:
+        if os.path.exists(_LOGO_PATH):
+            _LOGO_CACHE[height] = QPixmap(_LOGO_PATH).scaledToHeight(height, Qt.SmoothTransformation)
+        else:
+            _LOGO_CACHE[height] = None
+    return _LOGO_CACHE[height]
+
+
+def _write_json_atomic(path, data):
+    """Ecrit un JSON via un fichier temporaire + os.replace : un crash en
+    cours d'ecriture ne laisse jamais de fichier tronque"""
+    import json
+    import tempfile
+    tmp = None
     try:
-        return tuple(int(x) for x in v.split("."))
-    except (ValueError, AttributeError):
-        return (0, 0, 0)
+        # Nom temporaire unique : deux ecritures simultanees ne se marchent pas dessus
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=path.parent,
+                                         prefix=path.name + ".", suffix=".tmp",
+                                         delete=False) as f:
+            tmp = f.name
+            f.write(json.dumps(data))
+        os.replace(tmp, path)
+    except Exception:
+        if tmp:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+_TAG_NAME_RE = re.compile(rb'"tag_name"\s*:\s*"([^"\\]*)"')
+_VERSION_RE = re.compile(r"v?(\d+(?:\.\d+)*)(.*)")
+_SUFFIX_RE = re.compile(r"([a-z]*)[-._]?(\d*)")
+# Rang du suffixe : dev < alpha/beta/rc < finale (2) < post
+_SUFFIX_RANK = {"dev": 0, "a": 1, "b": 1, "rc": 1, "post": 3}
+_SUFFIX_ALIASES = {
+    "alpha": "a", "beta": "b", "c": "rc", "pre": "rc", "preview": "rc",
+    "r": "post", "rev": "post", "": "post",
+}
+
+
+@lru_cache(maxsize=64)
+def _version_tuple(v):
+    """Convertit '2.5.0rc10' en ((2, 5, 0), 1, 'rc', 10) pour comparaison.
+    Ordre : dev < alpha < beta < rc < finale < post ; '+local' est ignore."""
+    m = _VERSION_RE.fullmatch(v.strip().partition("+")[0]) if isinstance(v, str) else None
+    if not m:
+        return ((0, 0, 0), 2, "", 0)
+    nums = tuple(int(x) for x in m.group(1).split("."))
+    suffix = m.group(2).lstrip("-._").lower()
+    if not suffix:
+        return (nums, 2, "", 0)
+    s = _SUFFIX_RE.fullmatch(suffix)
+    if not s:
+        return (nums, 1, suffix, 0)
+    label = _SUFFIX_ALIASES.get(s.group(1), s.group(1))
+    # Etiquette inconnue : traitee comme pre-release (on ne propose pas la MAJ)
+    return (nums, _SUFFIX_RANK.get(label, 1), label, int(s.group(2) or 0))
 
 
 def version_gt(remote, local):
     """True si remote > local"""
-    return _version_tuple(remote) > _version_tuple(local)
+    return remote != local and _version_tuple(remote) > _version_tuple(local)
 
 
 # ============================================================
@@ -159,26 +241,46 @@ class GlitchLogoLabel(QWidget):
 class SplashScreen(QWidget):
     """Ecran de chargement au demarrage"""
 
+    # Feuille unique du splash (enfants designes par objectName) ; les couleurs
+    # des lignes de statut sont choisies par la propriete "hw"
+    STYLE = """
+        SplashScreen {
+            background: #1a1a1a;
+            border: 2px solid #00d4ff;
+        }
+        QLabel#splashMy    { color: #ffffff; background: transparent; }
+        QLabel#splashStrow { color: #FFE000; background: transparent; }
+        QLabel#splashVersion, QLabel#splashStatus { color: #666666; }
+        QLabel#hwLabel { color: #cccccc; }
+        QLabel[hw="pending"] { color: #888888; }
+        QLabel#hwIndicator[hw="pending"] { color: #666666; }
+        QLabel[hw="ok"]   { color: #4CAF50; }
+        QLabel[hw="warn"] { color: #ff9800; }
+        QLabel[hw="err"]  { color: #f44336; }
+        QProgressBar {
+            background: #333333;
+            border: none;
+            border-radius: 2px;
+        }
+        QProgressBar::chunk {
+            background: #00d4ff;
+            border-radius: 2px;
+        }
+    """
+
     def __init__(self):
         super().__init__(None, Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
         self.setFixedSize(420, 380)
         self.setAttribute(Qt.WA_TranslucentBackground, False)
-
-        self.setStyleSheet("""
-            SplashScreen {
-                background: #1a1a1a;
-                border: 2px solid #00d4ff;
-            }
-        """)
+        self.setStyleSheet(self.STYLE)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30, 20, 30, 16)
         layout.setSpacing(8)
 
         # --- Logo avec effet glitch ---
-        logo_path = resource_path("logo.png")
-        if os.path.exists(logo_path):
-            px = QPixmap(logo_path).scaledToHeight(80, Qt.SmoothTransformation)
+        px = _logo_pixmap(80)
+        if px is not None:
             self.logo_label = GlitchLogoLabel(px, self)
             logo_row = QHBoxLayout()
             logo_row.addStretch()
@@ -197,10 +299,10 @@ class SplashScreen(QWidget):
         _title_font.setLetterSpacing(QFont.AbsoluteSpacing, 2)
         lbl_my = QLabel("MY")
         lbl_my.setFont(_title_font)
-        lbl_my.setStyleSheet("color:#ffffff; background:transparent;")
+        lbl_my.setObjectName("splashMy")
         lbl_strow = QLabel("STROW")
         lbl_strow.setFont(_title_font)
-        lbl_strow.setStyleSheet("color:#FFE000; background:transparent;")
+        lbl_strow.setObjectName("splashStrow")
         title_row.addStretch()
         title_row.addWidget(lbl_my)
         title_row.addWidget(lbl_strow)
@@ -209,76 +311,73 @@ class SplashScreen(QWidget):
 
         # --- Version sous le titre ---
         ver = QLabel(f"v{VERSION}")
-        ver.setFont(QFont("Segoe UI", 10))
-        ver.setStyleSheet("color: #666666;")
+        ver.setFont(_font("Segoe UI", 10))
+        ver.setObjectName("splashVersion")
         ver.setAlignment(Qt.AlignCenter)
-        layout.addWidget(ver)
+        layout.addWidget(ver, 2)
 
         layout.addSpacing(10)
 
-        # --- Status hardware (AKAI, Node, Licence) ---
-        self.status_akai = self._create_status_row(tr("splash_akai_label"), tr("searching"))
-        layout.addLayout(self.status_akai["layout"])
-
-        self.status_node = self._create_status_row(tr("splash_dmx_label"), tr("searching"))
-        layout.addLayout(self.status_node["layout"])
-
-        self.status_license = self._create_status_row(tr("splash_license_label"), tr("verifying"))
-        layout.addLayout(self.status_license["layout"])
+        # --- Status hardware (AKAI, Node, Licence) : une seule grille ---
+        status_grid = QGridLayout()
+        status_grid.setContentsMargins(10, 2, 10, 2)
+        status_grid.setHorizontalSpacing(8)
+        # 12 = 2 + 8 + 2 : marges et espacement des anciennes lignes QHBoxLayout
+        status_grid.setVerticalSpacing(12)
+        status_grid.setColumnStretch(1, 1)
+        self.status_akai = self._create_status_row(
+            status_grid, 0, tr("splash_akai_label"), tr("searching"))
+        self.status_node = self._create_status_row(
+            status_grid, 1, tr("splash_dmx_label"), tr("searching"))
+        self.status_license = self._create_status_row(
+            status_grid, 2, tr("splash_license_label"), tr("verifying"))
+        # Facteurs 2/7/2 : la hauteur libre se repartit entre version, grille
+        # et statut comme avec les trois lignes separees (meme rendu)
+        layout.addLayout(status_grid, 7)
 
         layout.addSpacing(8)
 
         # --- Barre de progression ---
+        # Determinee (une etape par statut hardware resolu) : pas d'animation
+        # indeterminee qui repeint le splash en continu
+        self._hw_done = set()
         self.progress = QProgressBar()
-        self.progress.setRange(0, 0)  # Indeterminee
+        self.progress.setRange(0, 3)
+        self.progress.setValue(0)
         self.progress.setFixedHeight(4)
         self.progress.setTextVisible(False)
-        self.progress.setStyleSheet("""
-            QProgressBar {
-                background: #333333;
-                border: none;
-                border-radius: 2px;
-            }
-            QProgressBar::chunk {
-                background: #00d4ff;
-                border-radius: 2px;
-            }
-        """)
         layout.addWidget(self.progress)
 
         self.status_label = QLabel(tr("starting_app"))
-        self.status_label.setFont(QFont("Segoe UI", 9))
-        self.status_label.setStyleSheet("color: #666666;")
+        self.status_label.setFont(_font("Segoe UI", 9))
+        self.status_label.setObjectName("splashStatus")
         self.status_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(self.status_label)
+        layout.addWidget(self.status_label, 2)
 
         self._center_on_screen()
 
-    def _create_status_row(self, label_text, initial_value):
-        """Cree une ligne de statut avec indicateur et texte"""
-        row = QHBoxLayout()
-        row.setContentsMargins(10, 2, 10, 2)
-        row.setSpacing(8)
+    def _create_status_row(self, grid, row, label_text, initial_value):
+        """Ajoute une ligne de statut (indicateur, libelle, valeur) a la grille"""
+        font = _font("Segoe UI", 10)
 
         indicator = QLabel("\u25CF")  # Cercle plein
-        indicator.setFont(QFont("Segoe UI", 10))
-        indicator.setStyleSheet("color: #666666;")
+        indicator.setFont(font)
+        indicator.setObjectName("hwIndicator")
+        indicator.setProperty("hw", "pending")
         indicator.setFixedWidth(16)
-        row.addWidget(indicator)
+        grid.addWidget(indicator, row, 0)
 
         label = QLabel(label_text)
-        label.setFont(QFont("Segoe UI", 10))
-        label.setStyleSheet("color: #cccccc;")
-        row.addWidget(label)
-
-        row.addStretch()
+        label.setFont(font)
+        label.setObjectName("hwLabel")
+        grid.addWidget(label, row, 1)
 
         value = QLabel(initial_value)
-        value.setFont(QFont("Segoe UI", 10))
-        value.setStyleSheet("color: #888888;")
-        row.addWidget(value)
+        value.setFont(font)
+        value.setProperty("hw", "pending")
+        grid.addWidget(value, row, 2, Qt.AlignRight)
 
-        return {"layout": row, "indicator": indicator, "value": value, "label": label}
+        return {"indicator": indicator, "value": value, "label": label}
 
     def set_hw_label(self, target, text):
         """Met à jour l'étiquette gauche d'une ligne de statut hardware."""
@@ -295,14 +394,20 @@ class SplashScreen(QWidget):
         if not row:
             return
         if ok is True:
-            color = "#4CAF50"   # Vert
+            state = "ok"        # Vert
         elif ok is None:
-            color = "#ff9800"   # Orange (configure, non verifie)
+            state = "warn"      # Orange (configure, non verifie)
         else:
-            color = "#f44336"   # Rouge
-        row["indicator"].setStyleSheet(f"color: {color};")
-        row["value"].setStyleSheet(f"color: {color};")
+            state = "err"       # Rouge
+        # Re-polish avec la feuille du splash, sans reparser de QSS
+        for w in (row["indicator"], row["value"]):
+            if w.property("hw") != state:
+                w.setProperty("hw", state)
+                w.style().unpolish(w)
+                w.style().polish(w)
         row["value"].setText(text)
+        self._hw_done.add(target)
+        self.progress.setValue(len(self._hw_done))
 
     def _center_on_screen(self):
         screen = QApplication.primaryScreen()
@@ -330,19 +435,27 @@ class UpdateChecker(QThread):
         super().__init__()
         self.force = force
 
-    @staticmethod
-    def _ssl_context():
-        return _make_ssl_context()
+    def start_deferred(self, delay_ms=0):
+        """Demarre le thread au prochain passage de la boucle d'evenements.
+        A appeler apres avoir connecte les signaux, pour que le splash soit
+        peint avant l'initialisation du reseau (SSL, urllib)."""
+        QTimer.singleShot(delay_ms, self.start)
+
+    def _base_headers(self):
+        """En-tetes communs ; une verification manuelle (force) contourne
+        les caches intermediaires pour voir une release tout juste publiee"""
+        headers = {"User-Agent": "MyStrow-Updater"}
+        if self.force:
+            headers["Cache-Control"] = "no-cache, max-age=0"
+            headers["Pragma"] = "no-cache"
+        return headers
 
     def _get_latest_version_redirect(self):
         """Récupère la dernière version via la redirection GitHub releases/latest.
         Pas de rate limiting — aucun token requis."""
-        req = urllib.request.Request(
-            _RELEASES_LATEST,
-            headers={"User-Agent": "MyStrow-Updater"}
-        )
-        ctx = self._ssl_context()
-        with urllib.request.urlopen(req, timeout=8, context=ctx) as resp:
+        import urllib.request
+        req = urllib.request.Request(_RELEASES_LATEST, headers=self._base_headers())
+        with _get_opener().open(req, timeout=8) as resp:
             final_url = resp.geturl()   # URL finale après redirection
         # final_url = ".../releases/tag/v3.0.49"
         if "/tag/" not in final_url:
@@ -365,25 +478,85 @@ class UpdateChecker(QThread):
             "sig":    f"{base}/MyStrow.exe.sig",
         }
 
+    def _get_latest_version_api(self, cache):
+        """Fallback API GitHub en requête conditionnelle (ETag / Last-Modified).
+        Sur 304 la release n'a pas changé : on reprend le tag mis en cache."""
+        import json
+        import urllib.error
+        import urllib.request
+        headers = self._base_headers()
+        headers["Accept"] = "application/vnd.github.v3+json"
+        url = _UPDATE_API_URL
+        if self.force:
+            url += f"?_={int(time.time())}"
+        if cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+        if cache.get("last_modified"):
+            headers["If-Modified-Since"] = cache["last_modified"]
+        req = urllib.request.Request(url, headers=headers)
+        try:
+            with _get_opener().open(req, timeout=8) as resp:
+                cache["etag"] = resp.headers.get("ETag", "")
+                cache["last_modified"] = resp.headers.get("Last-Modified", "")
+                # tag_name est en tete de la release : on arrete la lecture
+                # des qu'il apparait (notes et assets ne sont ni lus ni parses)
+                raw = b""
+                m = None
+                while m is None:
+                    chunk = resp.read(4096)
+                    if not chunk:
+                        break
+                    raw += chunk
+                    m = _TAG_NAME_RE.search(raw)
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                raise
+            return cache.get("api_version")
+        if m is not None:
+            tag = m.group(1).decode("utf-8")
+        else:
+            tag = json.loads(raw).get("tag_name", "")
+        cache["api_version"] = tag.lstrip("v")
+        return cache["api_version"]
+
+    @staticmethod
+    def _load_cache():
+        import json
+        try:
+            return json.loads(UPDATE_CACHE_FILE.read_bytes())
+        except Exception:
+            return {}
+
+    @staticmethod
+    def _save_cache(cache):
+        _write_json_atomic(UPDATE_CACHE_FILE, cache)
+
     def run(self):
+        # Modules reseau importes a la demande (hors chemin critique du demarrage)
+        import urllib.error
         if self._reminder_active() and not self.force:
             self.check_finished.emit(False, "")
             return
+        cache = self._load_cache()
         try:
-            # ── 1. Obtenir la version via redirection (sans rate limit) ──
-            remote_version = self._get_latest_version_redirect()
+            # ── 0. Version vérifiée récemment : pas d'appel réseau ───────
+            remote_version = None
+            now = datetime.now().timestamp()
+            if not self.force and now - cache.get("cached_at", 0) < _UPDATE_CACHE_TTL:
+                remote_version = cache.get("version")
 
-            # ── 2. Fallback API si la redirection échoue ─────────────────
             if not remote_version:
-                req = urllib.request.Request(
-                    _UPDATE_API_URL,
-                    headers={"Accept": "application/vnd.github.v3+json",
-                             "User-Agent": "MyStrow-Updater"}
-                )
-                with urllib.request.urlopen(req, timeout=8,
-                                            context=self._ssl_context()) as resp:
-                    data = json.loads(resp.read().decode("utf-8"))
-                remote_version = data.get("tag_name", "").lstrip("v")
+                # ── 1. Obtenir la version via redirection (sans rate limit) ──
+                remote_version = self._get_latest_version_redirect()
+
+                # ── 2. Fallback API si la redirection échoue ─────────────────
+                if not remote_version:
+                    remote_version = self._get_latest_version_api(cache)
+
+                if remote_version:
+                    cache["version"] = remote_version
+                    cache["cached_at"] = now
+                    self._save_cache(cache)
 
             if not remote_version:
                 self.check_error.emit(tr("err_no_version"))
@@ -418,25 +591,34 @@ class UpdateChecker(QThread):
             else:
                 self.check_error.emit(msg)
 
+    # (mtime_ns, remind_after, version) du dernier REMINDER_FILE lu
+    _reminder_cache = None
+
     def _reminder_active(self):
+        import json
         try:
-            data = json.loads(REMINDER_FILE.read_text(encoding="utf-8"))
-            remind_after = datetime.fromisoformat(data["remind_after"])
-            stored_version = data.get("version", "")
+            mtime = REMINDER_FILE.stat().st_mtime_ns
+            cache = UpdateChecker._reminder_cache
+            if cache is None or cache[0] != mtime:
+                data = json.loads(REMINDER_FILE.read_bytes())
+                cache = (mtime,
+                         datetime.fromisoformat(data["remind_after"]),
+                         data.get("version", ""))
+                UpdateChecker._reminder_cache = cache
+            _, remind_after, stored_version = cache
             return datetime.now() < remind_after and stored_version != ""
         except Exception:
             return False
 
     @staticmethod
     def save_reminder(version):
-        try:
-            data = {
-                "remind_after": (datetime.now() + timedelta(hours=24)).isoformat(),
-                "version": version,
-            }
-            REMINDER_FILE.write_text(json.dumps(data), encoding="utf-8")
-        except Exception:
-            pass
+        """Enregistre le rappel dans 24h. L'ecriture se fait dans le pool de
+        threads Qt pour ne pas bloquer le clic "Plus tard"."""
+        data = {
+            "remind_after": (datetime.now() + timedelta(hours=24)).isoformat(),
+            "version": version,
+        }
+        QThreadPool.globalInstance().start(lambda: _write_json_atomic(REMINDER_FILE, data))
 
 
 # ============================================================
@@ -452,6 +634,32 @@ class UpdateBar(QWidget):
     _BORDER = "#00bcd4"
     _ACCENT = "#00bcd4"
 
+    # Feuille unique de la barre, enfants designes par objectName
+    STYLE = f"""
+        UpdateBar {{
+            background: qlineargradient(
+                x1:0, y1:0, x2:1, y2:0,
+                stop:0 {_BG}, stop:1 #1a1a1a
+            );
+            border: 1px solid {_BORDER};
+            border-radius: 5px;
+        }}
+        QLabel#updIcon {{ color: {_ACCENT}; background: transparent; border: none; }}
+        QFrame#updSep  {{ background: {_ACCENT}; border: none; }}
+        QLabel#updText {{ color: #fff; background: transparent; border: none; }}
+        QPushButton#updBtn {{
+            color: #000; background: {_ACCENT};
+            border: none; border-radius: 3px;
+            padding: 2px 12px; font-size: 9px; font-weight: bold;
+        }}
+        QPushButton#updBtn:hover {{ background: white; }}
+        QPushButton#updLater {{
+            color: rgba(255,255,255,0.45); background: transparent;
+            border: none; font-size: 11px; font-weight: bold;
+        }}
+        QPushButton#updLater:hover {{ color: white; }}
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.version  = ""
@@ -461,16 +669,7 @@ class UpdateBar(QWidget):
 
         self.setFixedHeight(38)
         self.setAttribute(Qt.WA_StyledBackground, True)
-        self.setStyleSheet(f"""
-            UpdateBar {{
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 {self._BG}, stop:1 #1a1a1a
-                );
-                border: 1px solid {self._BORDER};
-                border-radius: 5px;
-            }}
-        """)
+        self.setStyleSheet(self.STYLE)
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(10, 0, 8, 0)
@@ -480,9 +679,8 @@ class UpdateBar(QWidget):
         icon_lbl = QLabel("↑")
         icon_lbl.setFixedWidth(18)
         icon_lbl.setAlignment(Qt.AlignCenter)
-        icon_lbl.setStyleSheet("background: transparent; border: none;")
-        icon_lbl.setFont(QFont("Segoe UI", 12, QFont.Bold))
-        icon_lbl.setStyleSheet(f"color: {self._ACCENT}; background: transparent; border: none;")
+        icon_lbl.setFont(_font("Segoe UI", 12, QFont.Bold))
+        icon_lbl.setObjectName("updIcon")
         layout.addWidget(icon_lbl)
 
         # Separateur vertical
@@ -490,13 +688,13 @@ class UpdateBar(QWidget):
         sep.setFrameShape(QFrame.VLine)
         sep.setFixedWidth(1)
         sep.setFixedHeight(20)
-        sep.setStyleSheet(f"background: {self._ACCENT}; border: none;")
+        sep.setObjectName("updSep")
         layout.addWidget(sep)
 
         # Texte
         self.label = QLabel()
-        self.label.setFont(QFont("Segoe UI", 9, QFont.Bold))
-        self.label.setStyleSheet("color: #fff; background: transparent; border: none;")
+        self.label.setFont(_font("Segoe UI", 9, QFont.Bold))
+        self.label.setObjectName("updText")
         self.label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.label, 1)
 
@@ -504,14 +702,7 @@ class UpdateBar(QWidget):
         btn_update = QPushButton(tr("btn_update_arrow"))
         btn_update.setFixedHeight(24)
         btn_update.setCursor(Qt.PointingHandCursor)
-        btn_update.setStyleSheet(f"""
-            QPushButton {{
-                color: #000; background: {self._ACCENT};
-                border: none; border-radius: 3px;
-                padding: 2px 12px; font-size: 9px; font-weight: bold;
-            }}
-            QPushButton:hover {{ background: white; }}
-        """)
+        btn_update.setObjectName("updBtn")
         btn_update.clicked.connect(self.update_clicked)
         layout.addWidget(btn_update)
 
@@ -519,13 +710,7 @@ class UpdateBar(QWidget):
         btn_later = QPushButton("✕")
         btn_later.setFixedSize(22, 22)
         btn_later.setCursor(Qt.PointingHandCursor)
-        btn_later.setStyleSheet("""
-            QPushButton {
-                color: rgba(255,255,255,0.45); background: transparent;
-                border: none; font-size: 11px; font-weight: bold;
-            }
-            QPushButton:hover { color: white; }
-        """)
+        btn_later.setObjectName("updLater")
         btn_later.clicked.connect(self.later_clicked)
         layout.addWidget(btn_later)
 
@@ -540,14 +725,142 @@ class UpdateBar(QWidget):
 # ============================================================
 # DOWNLOAD + INSTALL
 # ============================================================
+class DownloadWorker(QThread):
+    """Telecharge un fichier en arriere-plan (hors thread UI).
+    Si hash_url est fourni, sha256.txt est recupere en parallele et le SHA256
+    du fichier est calcule au fil du telechargement (une seule passe).
+    Sans hash_url, aucun hachage (fichier existant ecrase sans controle)."""
+
+    progress = Signal(int, float, float)  # pct (-1 si taille inconnue), dl_mb, size_mb
+    done     = Signal(bool, str, str, str)  # ok, message d'erreur, sha256 obtenu, sha256 attendu
+
+    PROGRESS_INTERVAL = 0.1   # s : au plus ~10 mises a jour du dialogue par seconde
+
+    def __init__(self, url, dest, parent=None, hash_url=""):
+        super().__init__(parent)
+        self.url  = url
+        self.dest = dest
+        self.hash_url = hash_url
+
+    def _emit_progress(self, downloaded, total_size):
+        dl_mb = downloaded / 1048576
+        if total_size > 0:
+            # Pourcentage en arithmetique entiere (pas d'arrondi flottant)
+            pct = min(downloaded * 100 // total_size, 100)
+            self.progress.emit(pct, dl_mb, total_size / 1048576)
+        else:
+            self.progress.emit(-1, dl_mb, 0.0)
+
+    @staticmethod
+    def _file_sha256(path):
+        """SHA256 d'un fichier deja sur disque, hache via mmap ("" si illisible)"""
+        import hashlib
+        import mmap
+        try:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
+        except (OSError, ValueError):   # ValueError : fichier vide
+            return ""
+
+    @staticmethod
+    def _fetch_expected_hash(opener, hash_url):
+        """Premier champ de sha256.txt ("" si indisponible)"""
+        try:
+            with opener.open(hash_url, timeout=10) as resp:
+                return resp.read().decode("utf-8").strip().split()[0].lower()
+        except Exception:
+            return ""
+
+    def run(self):
+        import hashlib
+        import urllib.request
+        from concurrent.futures import ThreadPoolExecutor
+        opener = _get_opener()
+        pool = hash_future = sha = None
+        if self.hash_url:
+            # Quelques octets : recuperes pendant le telechargement principal
+            pool = ThreadPoolExecutor(max_workers=1)
+            hash_future = pool.submit(self._fetch_expected_hash, opener, self.hash_url)
+            sha = hashlib.sha256()
+        try:
+            # Fichier deja telecharge (ex. "Plus tard" puis "Mettre a jour") :
+            # s'il correspond a sha256.txt, pas de nouveau telechargement
+            if hash_future is not None and os.path.exists(self.dest):
+                expected_hash = hash_future.result()
+                if expected_hash and self._file_sha256(self.dest) == expected_hash:
+                    size = os.path.getsize(self.dest)
+                    self._emit_progress(size, size)
+                    self.done.emit(True, "", expected_hash, expected_hash)
+                    return
+
+            req = urllib.request.Request(self.url, headers={"User-Agent": "MyStrow-Updater"})
+            with opener.open(req, timeout=60) as resp:
+                total_size = int(resp.headers.get("Content-Length", 0))
+                downloaded = 0
+                last_emit = 0.0
+                # Tampon de 1 Mio reutilise (readinto) : pas d'objet bytes par bloc
+                buf = bytearray(1024 * 1024)
+                view = memoryview(buf)
+                with open(str(self.dest), "wb") as f:
+                    while True:
+                        n = resp.readinto(buf)
+                        if not n:
+                            break
+                        chunk = view[:n]
+                        f.write(chunk)
+                        if sha is not None:
+                            sha.update(chunk)
+                        downloaded += n
+                        # Signal limite dans le temps : pas un evenement par bloc
+                        now = time.monotonic()
+                        if now - last_emit >= self.PROGRESS_INTERVAL:
+                            last_emit = now
+                            self._emit_progress(downloaded, total_size)
+                self._emit_progress(downloaded, total_size)
+            expected_hash = hash_future.result() if hash_future is not None else ""
+        except Exception as e:
+            self.done.emit(False, str(e), "", "")
+            return
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False)
+        actual_hash = sha.hexdigest().lower() if sha is not None else ""
+        self.done.emit(True, "", actual_hash, expected_hash)
+
+
+# Feuille unique du dialogue de telechargement ; l'etape en cours est
+# choisie par la propriete "step"
+_DOWNLOAD_DLG_STYLE = """
+    * { background: #1e1e1e; color: #cccccc; }
+    QLabel#dlTitle  { color: #00d4ff; }
+    QLabel#dlStatus { color: #888888; }
+    QLabel[step="idle"]   { color: #555555; padding: 4px 10px; }
+    QLabel[step="active"] {
+        color: #00d4ff; font-weight: bold; padding: 4px 10px;
+        border-bottom: 2px solid #00d4ff;
+    }
+    QProgressBar {
+        background: #333333;
+        border: none;
+        border-radius: 7px;
+    }
+    QProgressBar::chunk {
+        background: #00d4ff;
+        border-radius: 7px;
+    }
+"""
+
+
 def download_update(parent, version, exe_url, hash_url, sig_url=""):
     """Telecharge la mise a jour avec verification SHA256 et lance le batch updater"""
+    import subprocess
+    import tempfile
 
     dlg = QDialog(parent)
     dlg.setWindowTitle(tr("update_dlg_title", ver=version))
     dlg.setFixedSize(460, 200)
     dlg.setWindowFlags(dlg.windowFlags() & ~Qt.WindowContextHelpButtonHint)
-    dlg.setStyleSheet("background: #1e1e1e; color: #cccccc;")
+    dlg.setStyleSheet(_DOWNLOAD_DLG_STYLE)
 
     layout = QVBoxLayout(dlg)
     layout.setContentsMargins(24, 20, 24, 20)
@@ -555,8 +868,8 @@ def download_update(parent, version, exe_url, hash_url, sig_url=""):
 
     # --- Titre ---
     title = QLabel(tr("update_dlg_heading", ver=version))
-    title.setFont(QFont("Segoe UI", 11, QFont.Bold))
-    title.setStyleSheet("color: #00d4ff;")
+    title.setFont(_font("Segoe UI", 11, QFont.Bold))
+    title.setObjectName("dlTitle")
     layout.addWidget(title)
 
     # --- Etapes visuelles ---
@@ -565,9 +878,9 @@ def download_update(parent, version, exe_url, hash_url, sig_url=""):
 
     def _make_step(text):
         lbl = QLabel(text)
-        lbl.setFont(QFont("Segoe UI", 9))
+        lbl.setFont(_font("Segoe UI", 9))
         lbl.setAlignment(Qt.AlignCenter)
-        lbl.setStyleSheet("color: #555555; padding: 4px 10px;")
+        lbl.setProperty("step", "idle")
         return lbl
 
     step_dl   = _make_step(tr("step_download"))
@@ -584,34 +897,23 @@ def download_update(parent, version, exe_url, hash_url, sig_url=""):
     progress.setValue(0)
     progress.setFixedHeight(14)
     progress.setTextVisible(False)
-    progress.setStyleSheet("""
-        QProgressBar {
-            background: #333333;
-            border: none;
-            border-radius: 7px;
-        }
-        QProgressBar::chunk {
-            background: #00d4ff;
-            border-radius: 7px;
-        }
-    """)
     layout.addWidget(progress)
 
     # --- Label de detail ---
     status_label = QLabel(tr("preparing"))
-    status_label.setFont(QFont("Segoe UI", 9))
-    status_label.setStyleSheet("color: #888888;")
+    status_label.setFont(_font("Segoe UI", 9))
+    status_label.setObjectName("dlStatus")
     status_label.setAlignment(Qt.AlignCenter)
     layout.addWidget(status_label)
 
     def _set_step(active_step):
-        """Met en evidence l'etape active"""
+        """Met en evidence l'etape active (re-polish des seules etapes modifiees)"""
         for s in (step_dl, step_check, step_inst):
-            s.setStyleSheet("color: #555555; padding: 4px 10px;")
-        active_step.setStyleSheet(
-            "color: #00d4ff; font-weight: bold; padding: 4px 10px; "
-            "border-bottom: 2px solid #00d4ff;"
-        )
+            state = "active" if s is active_step else "idle"
+            if s.property("step") != state:
+                s.setProperty("step", state)
+                s.style().unpolish(s)
+                s.style().polish(s)
 
     _set_step(step_dl)
     dlg.show()
@@ -630,61 +932,37 @@ def download_update(parent, version, exe_url, hash_url, sig_url=""):
     else:
         filename = "MyStrow.exe"
     new_file = update_dir / filename
+    verify_hash = bool(hash_url) and not is_installer
 
-    # --- Telechargement ---
-    try:
-        status_label.setText(tr("connecting_server"))
-        QApplication.processEvents()
-        req = urllib.request.Request(exe_url, headers={"User-Agent": "MyStrow-Updater"})
-        ctx = _make_ssl_context()
-        with urllib.request.urlopen(req, timeout=60, context=ctx) as resp:
-            total_size = int(resp.headers.get("Content-Length", 0))
-            downloaded = 0
-            block_size = 65536
-            with open(str(new_file), "wb") as f:
-                while True:
-                    chunk = resp.read(block_size)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if total_size > 0:
-                        pct = min(int(downloaded * 100 / total_size), 100)
-                        progress.setValue(pct)
-                        dl_mb = downloaded / (1024 * 1024)
-                        size_mb = total_size / (1024 * 1024)
-                        status_label.setText(tr("downloading_progress", dl_mb=dl_mb, size_mb=size_mb))
-                    else:
-                        status_label.setText(tr("downloading"))
-                    QApplication.processEvents()
-    except Exception as e:
-        dlg.close()
-        QMessageBox.critical(parent, tr("err_download_title"), tr("err_download_msg", err=e))
-        return
-
-    # --- Verification SHA256 (seulement si sha256.txt dispo) ---
-    _set_step(step_check)
-    progress.setRange(0, 0)  # indetermine pendant la verif
-    status_label.setText(tr("verifying_integrity"))
-    QApplication.processEvents()
+    # --- Telechargement (thread dedie, le dialogue suit via signaux) ---
+    status_label.setText(tr("connecting_server"))
 
-    if hash_url and not is_installer:
-        expected_hash = ""
-        try:
-            with urllib.request.urlopen(hash_url, timeout=10,
-                                        context=_make_ssl_context()) as resp:
-                content = resp.read().decode("utf-8").strip()
-                expected_hash = content.split()[0].lower()
-        except Exception:
-            expected_hash = ""
+    def _on_progress(pct, dl_mb, size_mb):
+        if pct >= 0:
+            progress.setValue(pct)
+            status_label.setText(tr("downloading_progress", dl_mb=dl_mb, size_mb=size_mb))
+        else:
+            status_label.setText(tr("downloading"))
 
-        if expected_hash:
-            sha = hashlib.sha256()
-            with open(new_file, "rb") as f:
-                for chunk in iter(lambda: f.read(8192), b""):
-                    sha.update(chunk)
-            actual_hash = sha.hexdigest().lower()
-            if actual_hash != expected_hash:
+    def _on_downloaded(ok, err, actual_hash, expected_hash):
+        if not ok:
+            dlg.close()
+            QMessageBox.critical(parent, tr("err_download_title"), tr("err_download_msg", err=err))
+            return
+        _verify_and_install(actual_hash, expected_hash)
+
+    def _verify_and_install(actual_hash, expected_hash):
+        # --- Verification SHA256 (seulement si sha256.txt dispo) ---
+        # L'installeur signe est verifie par Windows : pas d'etape de verification
+        if verify_hash:
+            _set_step(step_check)
+            progress.setRange(0, 0)  # indetermine pendant la verif
+            status_label.setText(tr("verifying_integrity"))
+            QApplication.processEvents()
+
+            # Les deux empreintes viennent du worker : sha256.txt recupere en
+            # parallele, fichier hache pendant le telechargement
+            if expected_hash and actual_hash != expected_hash:
                 dlg.close()
                 try:
                     new_file.unlink()
@@ -696,55 +974,64 @@ def download_update(parent, version, exe_url, hash_url, sig_url=""):
                                         actual=actual_hash[:16]))
                 return
 
-    # --- Installation ---
-    _set_step(step_inst)
-    progress.setRange(0, 0)
-    status_label.setText(tr("launching_installer"))
-    QApplication.processEvents()
-
-    if not getattr(sys, 'frozen', False):
-        dlg.close()
-        QMessageBox.information(parent, tr("dev_mode_title"), tr("dev_mode_msg", path=new_file))
-        return
-
-    # Petite pause pour que l'utilisateur voit l'etape installation
-    QTimer.singleShot(800, dlg.close)
-    QTimer.singleShot(800, QApplication.quit)
+        # --- Installation ---
+        _set_step(step_inst)
+        progress.setRange(0, 0)
+        status_label.setText(tr("launching_installer"))
+        QApplication.processEvents()
 
-    is_dmg = exe_url.lower().endswith(".dmg")
+        if not getattr(sys, 'frozen', False):
+            dlg.close()
+            QMessageBox.information(parent, tr("dev_mode_title"), tr("dev_mode_msg", path=new_file))
+            return
 
-    if is_dmg:
-        # Mac DMG : script shell qui monte le DMG, remplace le .app, relance
-        current_app = _get_mac_app_path()
-        shell_path = _create_updater_shell(str(new_file), current_app)
-        QTimer.singleShot(400, lambda: subprocess.Popen(
-            ["bash", str(shell_path)],
-            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-        ))
-    elif is_installer:
-        # Lancer l'installeur Inno Setup et quitter
-        # L'installeur déploie MyStrow.exe ET MyStrow.exe.sig → intégrité garantie
-        QTimer.singleShot(400, lambda: subprocess.Popen(
-            [str(new_file), "/SILENT", "/CLOSEAPPLICATIONS"]
-        ))
-    else:
-        # Fallback : batch replace (exe brut)
-        # Télécharger aussi le .sig pour que check_exe_integrity() passe au redémarrage
-        new_sig = None
-        if sig_url:
-            try:
-                new_sig = update_dir / "MyStrow.exe.sig"
-                urllib.request.urlretrieve(sig_url, str(new_sig))
-            except Exception:
-                new_sig = None   # sig indisponible : on continue sans
-        current_sig = sys.executable + ".sig"
-        batch_path = _create_updater_batch(str(new_file), sys.executable,
-                                           str(new_sig) if new_sig else "",
-                                           current_sig)
-        QTimer.singleShot(400, lambda: subprocess.Popen(
-            ["cmd.exe", "/c", str(batch_path)],
-            creationflags=subprocess.CREATE_NEW_CONSOLE
-        ))
+        # Petite pause pour que l'utilisateur voit l'etape installation
+        QTimer.singleShot(800, dlg.close)
+        QTimer.singleShot(800, QApplication.quit)
+
+        is_dmg = exe_url.lower().endswith(".dmg")
+
+        if is_dmg:
+            # Mac DMG : script shell qui monte le DMG, remplace le .app, relance
+            current_app = _get_mac_app_path()
+            shell_path = _create_updater_shell(str(new_file), current_app)
+            QTimer.singleShot(400, lambda: subprocess.Popen(
+                ["bash", str(shell_path)],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            ))
+        elif is_installer:
+            # Lancer l'installeur Inno Setup et quitter
+            # L'installeur déploie MyStrow.exe ET MyStrow.exe.sig → intégrité garantie
+            QTimer.singleShot(400, lambda: subprocess.Popen(
+                [str(new_file), "/SILENT", "/CLOSEAPPLICATIONS"]
+            ))
+        else:
+            # Fallback : batch replace (exe brut)
+            # Télécharger aussi le .sig pour que check_exe_integrity() passe au redémarrage
+            new_sig = None
+            if sig_url:
+                try:
+                    new_sig = update_dir / "MyStrow.exe.sig"
+                    with _get_opener().open(sig_url, timeout=30) as resp:
+                        new_sig.write_bytes(resp.read())
+                except Exception:
+                    new_sig = None   # sig indisponible : on continue sans
+            current_sig = sys.executable + ".sig"
+            batch_path = _create_updater_batch(str(new_file), sys.executable,
+                                               str(new_sig) if new_sig else "",
+                                               current_sig)
+            QTimer.singleShot(400, lambda: subprocess.Popen(
+                ["cmd.exe", "/c", str(batch_path)],
+                creationflags=subprocess.CREATE_NEW_CONSOLE
+            ))
+
+    # Installeur signe : pas de sha256.txt donc aucun hachage (ni reutilisation,
+    # ni calcul au fil du telechargement)
+    worker = DownloadWorker(exe_url, new_file, dlg, hash_url=hash_url if verify_hash else "")
+    worker.progress.connect(_on_progress)
+    worker.done.connect(_on_downloaded)
+    dlg._download_worker = worker
+    worker.start()
 
 
 # ============================================================
@@ -781,24 +1068,22 @@ class AboutDialog(QDialog):
         # Logo
         logo_lbl = QLabel()
         logo_lbl.setAlignment(Qt.AlignCenter)
-        logo_path = resource_path("logo.png")
-        if os.path.exists(logo_path):
-            px = QPixmap(logo_path)
-            px = px.scaledToHeight(64, Qt.SmoothTransformation)
+        px = _logo_pixmap(64)
+        if px is not None:
             logo_lbl.setPixmap(px)
         lay.addWidget(logo_lbl)
         lay.addSpacing(10)
 
         # Nom
         name_lbl = QLabel("MyStrow")
-        name_lbl.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        name_lbl.setFont(_font("Segoe UI", 18, QFont.Bold))
         name_lbl.setStyleSheet("color: #00d4ff;")
         name_lbl.setAlignment(Qt.AlignCenter)
         lay.addWidget(name_lbl)
 
         # Version
         ver_lbl = QLabel(f"v{VERSION}")
-        ver_lbl.setFont(QFont("Segoe UI", 10))
+        ver_lbl.setFont(_font("Segoe UI", 10))
         ver_lbl.setStyleSheet("color: #555;")
         ver_lbl.setAlignment(Qt.AlignCenter)
         lay.addWidget(ver_lbl)
@@ -815,7 +1100,7 @@ class AboutDialog(QDialog):
         box_lay.setSpacing(4)
 
         self.status_lbl = QLabel(tr("checking_updates"))
-        self.status_lbl.setFont(QFont("Segoe UI", 9))
+        self.status_lbl.setFont(_font("Segoe UI", 9))
         self.status_lbl.setStyleSheet("color: #555; background: transparent; border: none;")
         self.status_lbl.setAlignment(Qt.AlignCenter)
         self.status_lbl.setWordWrap(True)
@@ -1059,6 +1344,7 @@ def _get_mac_app_path() -> str:
 
 def _create_updater_shell(new_dmg: str, current_app: str) -> Path:
     """Crée le script shell de mise à jour Mac (DMG → remplacement .app + relance)."""
+    import tempfile
     script_path = Path(tempfile.gettempdir()) / "mystrow_update" / "update_mystrow.sh"
     script_path.parent.mkdir(parents=True, exist_ok=True)
     content = f"""#!/bin/bash
@@ -1083,6 +1369,7 @@ rm -f "$0"
 
 def _create_updater_batch(new_exe, current_exe, new_sig="", current_sig=""):
     """Cree le script batch de mise a jour (remplace exe + sig si disponibles)"""
+    import tempfile
     batch_path = Path(tempfile.gettempdir()) / "mystrow_update" / "update_mystrow.bat"
 
     # Copie du .sig si fourni (indispensable pour check_exe_integrity au redémarrage)